@@ -1,18 +1,28 @@
 import streamlit as st
 import pandas as pd
 import json
+import orjson
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import monotonic as _mono
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import google_auth_httplib2
+import httplib2
 import base64
 from io import BytesIO
 import xlsxwriter
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import diskcache
 from typing import List, Dict, Any
-import hashlib
 import os
 
 # Page configuration
@@ -56,73 +66,141 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# Inspection cache limits; entries beyond the cap are evicted least recently used first
+CACHE_TTL = timedelta(hours=24)
+CACHE_MAX_ENTRIES = 2000
+# The in-memory layer only holds entries briefly; the disk cache decides when a result expires
+MEMORY_CACHE_TTL = timedelta(minutes=15)
+# Persistent second-level cache, survives restarts and is shared between sessions
+DISK_CACHE_DIR = '.gsc_cache'
+DISK_CACHE_SIZE_LIMIT = 2 ** 30
+
+# Inspection results are stored column-wise, one list per field
+RESULT_FIELDS = ('url', 'status', 'data', 'error', 'timestamp')
+
+def empty_results() -> Dict[str, List[Any]]:
+    """Create an empty column-wise results buffer"""
+    return {name: [] for name in RESULT_FIELDS}
+
 # Initialize session state
-if 'inspection_results' not in st.session_state:
-    st.session_state.inspection_results = []
+if 'results_cols' not in st.session_state:
+    st.session_state.results_cols = empty_results()
+if 'df_results' not in st.session_state:
+    st.session_state.df_results = None
+if 'results_summary' not in st.session_state:
+    st.session_state.results_summary = None
 if 'authenticated' not in st.session_state:
     st.session_state.authenticated = False
 if 'service' not in st.session_state:
     st.session_state.service = None
+if 'credentials' not in st.session_state:
+    st.session_state.credentials = None
 if 'properties' not in st.session_state:
     st.session_state.properties = []
-if 'cache' not in st.session_state:
-    st.session_state.cache = {}
 if 'quota_usage' not in st.session_state:
-    st.session_state.quota_usage = {'daily': 0, 'per_minute': 0, 'last_reset': datetime.now()}
+    st.session_state.quota_usage = {'daily': 0, 'per_minute': 0, 'last_reset': datetime.now(), 'minute_reset': _mono()}
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.timestamp = _mono()
+        self._lock = threading.Lock()
+    
+    def take(self):
+        """Take a token, waiting only as long as it takes for one to become available"""
+        with self._lock:
+            now = _mono()
+            self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rate)
+            self.timestamp = now
+            # Reserve the token up front; a negative balance is the wait owed by this caller
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
 
 class GSCInspector:
-    def __init__(self, service):
+    def __init__(self, service, credentials=None, max_workers: int = 16):
         self.service = service
+        self.credentials = credentials
         self.daily_limit = 2000
         self.minute_limit = 600
-        
-    def get_cache_key(self, site_url: str, inspection_url: str) -> str:
-        """Generate cache key for URL inspection"""
-        return hashlib.md5(f"{site_url}:{inspection_url}".encode()).hexdigest()
+        self.max_workers = max_workers
+        self.account = getattr(credentials, 'service_account_email', '')
+        # Small burst, refilled so that burst + one minute of refill stays within minute_limit.
+        # Kept in the session next to quota_usage so pacing carries over between runs
+        if 'rate_limiter' not in st.session_state:
+            burst = 10
+            st.session_state.rate_limiter = TokenBucket(rate=(self.minute_limit - burst) / 60, capacity=burst)
+        # Worker threads share these session objects directly instead of going through st.session_state
+        self.rate_limiter = st.session_state.rate_limiter
+        self.quota_usage = st.session_state.quota_usage
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._executor = None
+        
+    def get_http(self):
+        """Get an authorized HTTP client for the current thread (httplib2 is not thread-safe)"""
+        if self.credentials is None:
+            return None
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
     
-    def check_quota(self) -> bool:
-        """Check if we're within quota limits"""
-        now = datetime.now()
-        
-        # Reset daily quota if needed
-        if now.date() > st.session_state.quota_usage['last_reset'].date():
-            st.session_state.quota_usage['daily'] = 0
-            st.session_state.quota_usage['last_reset'] = now
-        
-        # Check daily limit
-        if st.session_state.quota_usage['daily'] >= self.daily_limit:
-            return False
-            
-        # Reset minute counter if needed
-        if now - st.session_state.quota_usage.get('minute_reset', now) > timedelta(minutes=1):
-            st.session_state.quota_usage['per_minute'] = 0
-            st.session_state.quota_usage['minute_reset'] = now
-            
-        # Check minute limit
-        if st.session_state.quota_usage['per_minute'] >= self.minute_limit:
-            return False
+    def reserve_quota(self) -> bool:
+        """Claim one request from the quota, returning False if the daily limit has been reached"""
+        while True:
+            # Checking and counting under one lock keeps concurrent workers from overshooting a limit
+            with self._lock:
+                now = datetime.now()
+                
+                # Reset daily quota if needed
+                if now.date() > self.quota_usage['last_reset'].date():
+                    self.quota_usage['daily'] = 0
+                    self.quota_usage['last_reset'] = now
+                
+                # Check daily limit
+                if self.quota_usage['daily'] >= self.daily_limit:
+                    return False
+                    
+                # Reset minute counter if needed
+                mono_now = _mono()
+                elapsed = mono_now - self.quota_usage['minute_reset']
+                if elapsed >= 60:
+                    self.quota_usage['per_minute'] = 0
+                    self.quota_usage['minute_reset'] = mono_now
+                    elapsed = 0
+                    
+                # Check minute limit
+                if self.quota_usage['per_minute'] < self.minute_limit:
+                    self.quota_usage['daily'] += 1
+                    self.quota_usage['per_minute'] += 1
+                    return True
             
-        return True
-    
-    def update_quota(self):
-        """Update quota usage"""
-        st.session_state.quota_usage['daily'] += 1
-        st.session_state.quota_usage['per_minute'] += 1
+            # Minute limit reached: wait for the window to reset instead of failing the URL
+            time.sleep(60 - elapsed)
     
     def inspect_url(self, site_url: str, inspection_url: str, use_cache: bool = True) -> Dict[str, Any]:
         """Inspect a single URL"""
-        cache_key = self.get_cache_key(site_url, inspection_url)
-        
-        # Check cache first
-        if use_cache and cache_key in st.session_state.cache:
-            cached_data = st.session_state.cache[cache_key]
-            if datetime.now() - cached_data['timestamp'] < timedelta(hours=24):
-                return cached_data['data']
-        
-        # Check quota
-        if not self.check_quota():
-            raise Exception("Quota limit reached. Please try again later.")
-        
+        # Cache hits return here, before any quota or rate limiting work
+        if use_cache:
+            return _cached_inspect(self.account, site_url, inspection_url, self)
+        
+        # Bypassing the cache still refreshes it with the new response
+        response = self.fetch_inspection(site_url, inspection_url)
+        get_disk_cache().set(
+            (self.account, site_url, inspection_url),
+            response,
+            expire=CACHE_TTL.total_seconds()
+        )
+        return response
+    
+    def fetch_inspection(self, site_url: str, inspection_url: str) -> Dict[str, Any]:
+        """Inspect a single URL through the API, bypassing the cache"""
         try:
             request = {
                 'siteUrl': site_url,
@@ -130,205 +208,372 @@ class GSCInspector:
                 'languageCode': 'en-US'
             }
             
-            response = self.service.urlInspection().index().inspect(body=request).execute()
+            # Wait for a token first so workers queued in the bucket don't hold quota they haven't used yet
+            self.rate_limiter.take()
             
-            # Update quota
-            self.update_quota()
+            # Check and update quota right before the request is sent
+            if not self.reserve_quota():
+                raise Exception("Daily quota limit reached. Please try again later.")
             
-            # Cache the result
-            st.session_state.cache[cache_key] = {
-                'data': response,
-                'timestamp': datetime.now()
-            }
+            response = self.service.urlInspection().index().inspect(body=request).execute(http=self.get_http())
             
             return response
             
         except HttpError as e:
-            error_content = json.loads(e.content.decode())
+            error_content = orjson.loads(e.content)
             raise Exception(f"API Error: {error_content.get('error', {}).get('message', 'Unknown error')}")
     
-    def batch_inspect(self, site_url: str, urls: List[str], progress_callback=None) -> List[Dict[str, Any]]:
-        """Inspect multiple URLs with rate limiting"""
-        results = []
+    def _inspect_one(self, site_url: str, url: str, use_cache: bool) -> tuple:
+        """Inspect a single URL, capturing any error in the result (fields in RESULT_FIELDS order)"""
+        try:
+            result = self.inspect_url(site_url, url, use_cache=use_cache)
+            status, error = 'success', None
+        except Exception as e:
+            result, status, error = None, 'error', str(e)
+        
+        return url, status, result, error, datetime.now().isoformat()
+    
+    def get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool, kept alive across batches so each worker reuses its connection"""
+        if self._executor is None:
+            # Workers need the script context to use st.cache_data
+            ctx = get_script_run_ctx()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+            )
+        return self._executor
+    
+    def close(self):
+        """Shut down the worker pool, dropping URLs that haven't started"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+    
+    def batch_inspect(self, site_url: str, urls: List[str], progress_callback=None, use_cache: bool = True) -> Dict[str, List[Any]]:
+        """Inspect multiple URLs concurrently with rate limiting, returning results column-wise"""
+        results = {name: [None] * len(urls) for name in RESULT_FIELDS}
         total_urls = len(urls)
         
-        for i, url in enumerate(urls):
-            try:
-                # Rate limiting - wait if we're approaching minute limit
-                if st.session_state.quota_usage['per_minute'] >= self.minute_limit - 10:
-                    time.sleep(60)  # Wait a minute
-                    st.session_state.quota_usage['per_minute'] = 0
-                    st.session_state.quota_usage['minute_reset'] = datetime.now()
-                
-                result = self.inspect_url(site_url, url)
-                results.append({
-                    'url': url,
-                    'status': 'success',
-                    'data': result,
-                    'timestamp': datetime.now().isoformat()
-                })
-                
-                # Small delay to avoid hitting rate limits
-                time.sleep(0.1)
-                
-            except Exception as e:
-                results.append({
-                    'url': url,
-                    'status': 'error',
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                })
+        executor = self.get_executor()
+        futures = {executor.submit(self._inspect_one, site_url, url, use_cache): i for i, url in enumerate(urls)}
+        
+        # Results are collected on the calling thread so the callback can update the UI
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            for name, value in zip(RESULT_FIELDS, future.result()):
+                results[name][i] = value
             
             if progress_callback:
-                progress_callback((i + 1) / total_urls, f"Processed {i + 1} of {total_urls} URLs")
+                progress_callback(done / total_urls, f"Processed {done} of {total_urls} URLs")
         
         return results
 
+@st.cache_resource(show_spinner=False)
+def get_disk_cache() -> diskcache.Cache:
+    """Open the on-disk inspection cache"""
+    return diskcache.Cache(
+        DISK_CACHE_DIR,
+        size_limit=DISK_CACHE_SIZE_LIMIT,
+        eviction_policy='least-recently-used'
+    )
+
+@st.cache_data(ttl=MEMORY_CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_inspect(account: str, site_url: str, inspection_url: str, _inspector: GSCInspector) -> Dict[str, Any]:
+    """Inspect a URL through the in-memory and on-disk 24h caches; only misses reach the API"""
+    disk_cache = get_disk_cache()
+    key = (account, site_url, inspection_url)
+    
+    response, expire_at = disk_cache.get(key, expire_time=True)
+    # An entry about to expire would outlive its 24h in the memory layer, so treat it as a miss
+    if response is None or expire_at - time.time() < MEMORY_CACHE_TTL.total_seconds():
+        response = _inspector.fetch_inspection(site_url, inspection_url)
+        disk_cache.set(key, response, expire=CACHE_TTL.total_seconds())
+    return response
+
+@st.cache_resource(show_spinner=False)
+def get_service(credentials_json: Dict[str, Any]) -> Any:
+    """Build the Search Console service once per set of credentials"""
+    credentials = service_account.Credentials.from_service_account_info(
+        credentials_json,
+        scopes=['https://www.googleapis.com/auth/webmasters.readonly']
+    )
+    
+    # Use the discovery document bundled with the client instead of fetching it over the network
+    service = build(
+        'searchconsole',
+        'v1',
+        credentials=credentials,
+        cache_discovery=False,
+        static_discovery=True
+    )
+    
+    return service, credentials
+
 def authenticate_gsc(credentials_json: Dict[str, Any]) -> Any:
     """Authenticate with Google Search Console API"""
     try:
-        credentials = service_account.Credentials.from_service_account_info(
-            credentials_json,
-            scopes=['https://www.googleapis.com/auth/webmasters.readonly']
-        )
+        service, credentials = get_service(credentials_json)
         
-        service = build('searchconsole', 'v1', credentials=credentials)
-        
-        # Test authentication by getting site list
-        sites = service.sites().list().execute()
+        # Test authentication by getting site list. The cached service is shared between
+        # sessions, so use a client of our own rather than its single httplib2.Http
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+        sites = service.sites().list().execute(http=http)
         properties = [site['siteUrl'] for site in sites.get('siteEntry', [])]
         
-        return service, properties
+        return service, credentials, properties
         
     except Exception as e:
         raise Exception(f"Authentication failed: {str(e)}")
 
-def parse_inspection_result(result: Dict[str, Any]) -> Dict[str, Any]:
-    """Parse inspection result into a flat dictionary"""
-    parsed = {
-        'inspection_url': result.get('url', ''),
-        'inspection_result_link': '',
-        'verdict': '',
-        'coverage_state': '',
-        'indexing_state': '',
-        'last_crawl_time': '',
-        'page_fetch_state': '',
-        'robots_txt_state': '',
-        'user_canonical': '',
-        'google_canonical': '',
-        'mobile_verdict': '',
-        'rich_results_verdict': '',
-        'rich_results_detected': '',
-        'crawled_as': ''
+def _join_rich_result_types(items) -> str:
+    """Join detected rich result types into a comma-separated string"""
+    return ', '.join(item.get('richResultType', '') for item in items or [])
+
+# Parsed result columns: (column name, inspectionResult section or None for top level, field, converter)
+PARSED_COLUMNS = [
+    ('inspection_result_link', None, 'inspectionResultLink', None),
+    ('verdict', 'indexStatusResult', 'verdict', None),
+    ('coverage_state', 'indexStatusResult', 'coverageState', None),
+    ('indexing_state', 'indexStatusResult', 'indexingState', None),
+    ('last_crawl_time', 'indexStatusResult', 'lastCrawlTime', None),
+    ('page_fetch_state', 'indexStatusResult', 'pageFetchState', None),
+    ('robots_txt_state', 'indexStatusResult', 'robotsTxtState', None),
+    ('user_canonical', 'indexStatusResult', 'userCanonical', None),
+    ('google_canonical', 'indexStatusResult', 'googleCanonical', None),
+    ('mobile_verdict', 'mobileUsabilityResult', 'verdict', None),
+    ('rich_results_verdict', 'richResultsResult', 'verdict', None),
+    ('rich_results_detected', 'richResultsResult', 'detectedItems', _join_rich_result_types),
+    ('crawled_as', 'indexStatusResult', 'crawledAs', None)
+]
+
+def _compile_result_parser(columns: List[tuple]):
+    """Generate a straight-line parser that returns one tuple per API response, in column order"""
+    sections = list(dict.fromkeys(section for _, section, _, _ in columns if section))
+    namespace = {}
+    lines = [
+        "def parse(data):",
+        "    ir = data.get('inspectionResult') or {}"
+    ]
+    for n, section in enumerate(sections):
+        lines.append(f"    s{n} = ir.get({section!r}) or {{}}")
+    
+    fields = []
+    for n, (_, section, field, converter) in enumerate(columns):
+        source = 'ir' if section is None else f"s{sections.index(section)}"
+        if converter is None:
+            fields.append(f"{source}.get({field!r}, '')")
+        else:
+            namespace[f'convert{n}'] = converter
+            fields.append(f"convert{n}({source}.get({field!r}))")
+    lines.append(f"    return ({', '.join(fields)},)")
+    
+    exec(compile('\n'.join(lines), '<inspection-result-parser>', 'exec'), namespace)
+    return namespace['parse']
+
+_parse_result = _compile_result_parser(PARSED_COLUMNS)
+
+# Rows per page in the results table
+PAGE_SIZE = 100
+
+# Coverage states that mean the URL is in Google's index
+INDEXED_STATES = frozenset({
+    'Submitted and indexed',
+    'Indexed, not submitted in sitemap',
+    'Indexed, though blocked by robots.txt',
+    'Page indexed without content',
+    'Indexed'
+})
+
+def build_results_dataframe(results: Dict[str, List[Any]]) -> pd.DataFrame:
+    """Flatten column-wise inspection results into a DataFrame, keeping the input order"""
+    urls, statuses, data, errors, timestamps = (results[name] for name in RESULT_FIELDS)
+    success_idx = [i for i, status in enumerate(statuses) if status == 'success']
+    error_idx = [i for i, status in enumerate(statuses) if status != 'success']
+    
+    # Successful inspections: one tuple per response from the generated parser
+    df_ok = pd.DataFrame(
+        [_parse_result(data[i]) for i in success_idx],
+        columns=[name for name, _, _, _ in PARSED_COLUMNS],
+        index=success_idx
+    )
+    df_ok.insert(0, 'inspection_url', [urls[i] for i in success_idx])
+    df_ok['url'] = df_ok['inspection_url']
+    df_ok['status'] = 'success'
+    df_ok['timestamp'] = [timestamps[i] for i in success_idx]
+    
+    # Failed inspections
+    df_err = pd.DataFrame({
+        'url': [urls[i] for i in error_idx],
+        'status': 'error',
+        'error': [errors[i] or 'Unknown error' for i in error_idx],
+        'timestamp': [timestamps[i] for i in error_idx]
+    }, index=error_idx)
+    
+    frames = [df for df in (df_ok, df_err) if not df.empty]
+    df = pd.concat(frames).sort_index().reset_index(drop=True) if frames else df_ok
+    
+    # Coverage states are a small vocabulary, so filtering on codes is cheaper than on strings
+    if 'coverage_state' in df.columns:
+        df['coverage_state'] = df['coverage_state'].astype('category')
+    return df
+
+# Columns charted in the visualizations section
+CHART_COLUMNS = ('coverage_state', 'mobile_verdict', 'page_fetch_state', 'crawled_as')
+
+def summarize_results(df: pd.DataFrame) -> Dict[str, Any]:
+    """Precompute the metrics, chart counts and filter options for a result set"""
+    is_success = df['status'] == 'success'
+    summary = {
+        'success_count': int(is_success.sum()),
+        'error_count': int((df['status'] == 'error').sum()),
+        'indexed_count': None,
+        'counts': {},
+        'filter_options': {'status': df['status'].unique().tolist()}
     }
     
-    if 'inspectionResult' in result.get('data', {}):
-        inspection = result['data']['inspectionResult']
-        parsed['inspection_result_link'] = inspection.get('inspectionResultLink', '')
-        
-        # Index status
-        if 'indexStatusResult' in inspection:
-            idx_status = inspection['indexStatusResult']
-            parsed['verdict'] = idx_status.get('verdict', '')
-            parsed['coverage_state'] = idx_status.get('coverageState', '')
-            parsed['indexing_state'] = idx_status.get('indexingState', '')
-            parsed['last_crawl_time'] = idx_status.get('lastCrawlTime', '')
-            parsed['page_fetch_state'] = idx_status.get('pageFetchState', '')
-            parsed['robots_txt_state'] = idx_status.get('robotsTxtState', '')
-            parsed['user_canonical'] = idx_status.get('userCanonical', '')
-            parsed['google_canonical'] = idx_status.get('googleCanonical', '')
-            parsed['crawled_as'] = idx_status.get('crawledAs', '')
-        
-        # Mobile usability
-        if 'mobileUsabilityResult' in inspection:
-            parsed['mobile_verdict'] = inspection['mobileUsabilityResult'].get('verdict', '')
-        
-        # Rich results
-        if 'richResultsResult' in inspection:
-            rich_results = inspection['richResultsResult']
-            parsed['rich_results_verdict'] = rich_results.get('verdict', '')
-            detected_items = rich_results.get('detectedItems', [])
-            parsed['rich_results_detected'] = ', '.join([item.get('richResultType', '') for item in detected_items])
+    if 'coverage_state' in df.columns:
+        summary['indexed_count'] = int(df['coverage_state'].isin(INDEXED_STATES).sum())
+        df_success = df[is_success]
+        for col in CHART_COLUMNS:
+            counts = df_success[col].value_counts()
+            summary['counts'][col] = (tuple(counts.index.tolist()), tuple(counts.tolist()))
+        for col in ('coverage_state', 'mobile_verdict'):
+            summary['filter_options'][col] = df[col].dropna().unique().tolist()
     
-    return parsed
+    return summary
 
-def create_visualizations(df: pd.DataFrame):
-    """Create visualizations from inspection results"""
+def results_to_records(results: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Convert column-wise results back to one record per URL for JSON export"""
+    records = []
+    for url, status, data, error, timestamp in zip(*(results[name] for name in RESULT_FIELDS)):
+        record = {'url': url, 'status': status}
+        if status == 'success':
+            record['data'] = data
+        else:
+            record['error'] = error
+        record['timestamp'] = timestamp
+        records.append(record)
+    return records
+
+@st.cache_data(show_spinner=False)
+def _pie_chart(labels: tuple, values: tuple, title: str, colors: tuple) -> go.Figure:
+    """Build (and cache) a pie chart from precomputed counts"""
+    return px.pie(
+        values=values,
+        names=labels,
+        title=title,
+        color_discrete_sequence=colors
+    )
+
+@st.cache_data(show_spinner=False)
+def _bar_chart(labels: tuple, values: tuple, title: str, x_label: str, color_map: Dict[str, str]) -> go.Figure:
+    """Build (and cache) a bar chart from precomputed counts"""
+    return px.bar(
+        x=labels,
+        y=values,
+        title=title,
+        labels={'x': x_label, 'y': 'Count'},
+        color=labels,
+        color_discrete_map=color_map
+    )
+
+def create_visualizations(counts: Dict[str, tuple]):
+    """Create visualizations from precomputed (labels, values) counts"""
     col1, col2 = st.columns(2)
     
     with col1:
         # Indexing status pie chart
-        status_counts = df['coverage_state'].value_counts()
-        fig_status = px.pie(
-            values=status_counts.values,
-            names=status_counts.index,
-            title="Coverage State Distribution",
-            color_discrete_sequence=px.colors.qualitative.Set3
+        fig_status = _pie_chart(
+            *counts['coverage_state'],
+            "Coverage State Distribution",
+            tuple(px.colors.qualitative.Set3)
         )
         st.plotly_chart(fig_status, use_container_width=True)
         
         # Mobile usability
-        mobile_counts = df['mobile_verdict'].value_counts()
-        fig_mobile = px.bar(
-            x=mobile_counts.index,
-            y=mobile_counts.values,
-            title="Mobile Usability Status",
-            labels={'x': 'Verdict', 'y': 'Count'},
-            color=mobile_counts.index,
-            color_discrete_map={'PASS': 'green', 'FAIL': 'red', 'NEUTRAL': 'gray'}
+        fig_mobile = _bar_chart(
+            *counts['mobile_verdict'],
+            "Mobile Usability Status",
+            'Verdict',
+            {'PASS': 'green', 'FAIL': 'red', 'NEUTRAL': 'gray'}
         )
         st.plotly_chart(fig_mobile, use_container_width=True)
     
     with col2:
         # Page fetch state
-        fetch_counts = df['page_fetch_state'].value_counts()
-        fig_fetch = px.pie(
-            values=fetch_counts.values,
-            names=fetch_counts.index,
-            title="Page Fetch State Distribution",
-            color_discrete_sequence=px.colors.qualitative.Pastel
+        fig_fetch = _pie_chart(
+            *counts['page_fetch_state'],
+            "Page Fetch State Distribution",
+            tuple(px.colors.qualitative.Pastel)
         )
         st.plotly_chart(fig_fetch, use_container_width=True)
         
         # Crawled as (Mobile vs Desktop)
-        crawled_counts = df['crawled_as'].value_counts()
-        fig_crawled = px.bar(
-            x=crawled_counts.index,
-            y=crawled_counts.values,
-            title="Crawled As (Mobile vs Desktop)",
-            labels={'x': 'Crawled As', 'y': 'Count'},
-            color=crawled_counts.index,
-            color_discrete_map={'MOBILE': 'blue', 'DESKTOP': 'orange'}
+        fig_crawled = _bar_chart(
+            *counts['crawled_as'],
+            "Crawled As (Mobile vs Desktop)",
+            'Crawled As',
+            {'MOBILE': 'blue', 'DESKTOP': 'orange'}
         )
         st.plotly_chart(fig_crawled, use_container_width=True)
 
+def _to_arrow(df: pd.DataFrame) -> pa.Table:
+    """Convert a results DataFrame to an Arrow table"""
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+def export_to_csv(df: pd.DataFrame) -> bytes:
+    """Export DataFrame to CSV bytes"""
+    table = _to_arrow(df)
+    # The CSV writer needs plain values, so decode categorical (dictionary) columns
+    columns = [
+        column.cast(column.type.value_type) if pa.types.is_dictionary(column.type) else column
+        for column in table.columns
+    ]
+    table = pa.Table.from_arrays(columns, names=table.column_names)
+    
+    output = pa.BufferOutputStream()
+    pa_csv.write_csv(table, output)
+    return output.getvalue().to_pybytes()
+
+def export_to_parquet(df: pd.DataFrame) -> bytes:
+    """Export DataFrame to zstd-compressed Parquet bytes"""
+    output = pa.BufferOutputStream()
+    pq.write_table(_to_arrow(df), output, compression='zstd')
+    return output.getvalue().to_pybytes()
+
 def export_to_excel(df: pd.DataFrame) -> BytesIO:
     """Export DataFrame to Excel with formatting"""
     output = BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        df.to_excel(writer, sheet_name='URL Inspection Results', index=False)
-        
-        workbook = writer.book
-        worksheet = writer.sheets['URL Inspection Results']
-        
-        # Add formatting
-        header_format = workbook.add_format({
-            'bold': True,
-            'text_wrap': True,
-            'valign': 'top',
-            'fg_color': '#D7E4BD',
-            'border': 1
-        })
-        
-        # Write headers with formatting
-        for col_num, value in enumerate(df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
-        
-        # Auto-fit columns
-        for i, col in enumerate(df.columns):
-            column_width = max(df[col].astype(str).str.len().max(), len(col)) + 2
-            worksheet.set_column(i, i, min(column_width, 50))
+    # constant_memory flushes each row as it's written, so rows must be written in order
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+    worksheet = workbook.add_worksheet('URL Inspection Results')
+    
+    # Add formatting
+    header_format = workbook.add_format({
+        'bold': True,
+        'text_wrap': True,
+        'valign': 'top',
+        'fg_color': '#D7E4BD',
+        'border': 1
+    })
+    
+    # Auto-fit columns, estimating widths from the first rows only
+    sample = df.head(200).astype(str)
+    for i, col in enumerate(df.columns):
+        sample_width = int(sample[col].str.len().max()) if len(sample) else 0
+        column_width = max(sample_width, len(str(col))) + 2
+        worksheet.set_column(i, i, min(column_width, 50))
     
+    # Write headers with formatting
+    worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+    
+    # Stream the data rows
+    values = df.astype(object).where(df.notna(), '')
+    for row_num, row in enumerate(values.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_num, 0, row)
+    
+    workbook.close()
     output.seek(0)
     return output
 
@@ -350,8 +595,9 @@ def main():
             if uploaded_file is not None:
                 try:
                     credentials = json.load(uploaded_file)
-                    service, properties = authenticate_gsc(credentials)
+                    service, gsc_credentials, properties = authenticate_gsc(credentials)
                     st.session_state.service = service
+                    st.session_state.credentials = gsc_credentials
                     st.session_state.properties = properties
                     st.session_state.authenticated = True
                     st.success("✅ Authentication successful!")
@@ -363,6 +609,7 @@ def main():
             if st.button("🚪 Logout"):
                 st.session_state.authenticated = False
                 st.session_state.service = None
+                st.session_state.credentials = None
                 st.session_state.properties = []
                 st.rerun()
         
@@ -377,13 +624,12 @@ def main():
         st.subheader("💾 Cache Settings")
         use_cache = st.checkbox("Use cache (24h)", value=True)
         if st.button("🗑️ Clear Cache"):
-            st.session_state.cache = {}
+            _cached_inspect.clear()
+            get_disk_cache().clear()
             st.success("Cache cleared!")
     
     # Main content
     if st.session_state.authenticated:
-        inspector = GSCInspector(st.session_state.service)
-        
         # Property selection
         st.subheader("🌐 Select Property")
         selected_property = st.selectbox(
@@ -409,28 +655,43 @@ def main():
             url_column = st.text_input("URL column name", value="url")
         
         # Inspection options
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
         with col1:
             batch_size = st.number_input("Batch size", min_value=1, max_value=100, value=10)
         with col2:
             delay_between_batches = st.number_input("Delay between batches (seconds)", min_value=0, max_value=60, value=5)
         with col3:
-            export_format = st.selectbox("Export format", ["CSV", "Excel", "JSON"])
+            max_concurrency = st.number_input(
+                "Concurrent requests",
+                min_value=1,
+                max_value=32,
+                value=16,
+                help="Maximum number of inspections in flight at once"
+            )
+        with col4:
+            export_format = st.selectbox("Export format", ["CSV", "Excel", "JSON", "Parquet"])
         
         # Start inspection
         if st.button("🚀 Start Inspection", type="primary"):
             # Prepare URLs
-            urls_to_inspect = []
+            raw_urls = []
             
             if urls_text:
-                urls_to_inspect = [url.strip() for url in urls_text.split('\n') if url.strip()]
+                raw_urls = [url.strip() for url in urls_text.split('\n') if url.strip()]
             elif uploaded_csv:
                 df_urls = pd.read_csv(uploaded_csv)
                 if url_column in df_urls.columns:
-                    urls_to_inspect = df_urls[url_column].dropna().tolist()
+                    csv_urls = df_urls[url_column].dropna().astype(str).str.strip()
+                    raw_urls = csv_urls[csv_urls != ''].tolist()
                 else:
                     st.error(f"Column '{url_column}' not found in CSV")
             
+            # Drop duplicates up front so they don't cost a lookup or quota, keeping input order
+            urls_to_inspect = list(dict.fromkeys(raw_urls))
+            duplicates_removed = len(raw_urls) - len(urls_to_inspect)
+            if duplicates_removed:
+                st.caption(f"{duplicates_removed} duplicate URLs removed")
+            
             if urls_to_inspect:
                 st.info(f"🔄 Starting inspection of {len(urls_to_inspect)} URLs...")
                 
@@ -438,60 +699,63 @@ def main():
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                # Process URLs in batches
-                all_results = []
-                for i in range(0, len(urls_to_inspect), batch_size):
-                    batch = urls_to_inspect[i:i+batch_size]
-                    
-                    def update_progress(progress, text):
-                        overall_progress = (i + progress * len(batch)) / len(urls_to_inspect)
-                        progress_bar.progress(overall_progress)
-                        status_text.text(text)
-                    
-                    batch_results = inspector.batch_inspect(
-                        selected_property,
-                        batch,
-                        progress_callback=update_progress
-                    )
-                    all_results.extend(batch_results)
-                    
-                    # Delay between batches
-                    if i + batch_size < len(urls_to_inspect):
-                        time.sleep(delay_between_batches)
+                # Process URLs in batches, sharing one worker pool across batches
+                inspector = GSCInspector(
+                    st.session_state.service,
+                    st.session_state.credentials,
+                    max_workers=max_concurrency
+                )
+                all_results = empty_results()
+                try:
+                    for i in range(0, len(urls_to_inspect), batch_size):
+                        batch = urls_to_inspect[i:i+batch_size]
+                        
+                        def update_progress(progress, text):
+                            overall_progress = (i + progress * len(batch)) / len(urls_to_inspect)
+                            progress_bar.progress(overall_progress)
+                            status_text.text(text)
+                        
+                        batch_results = inspector.batch_inspect(
+                            selected_property,
+                            batch,
+                            progress_callback=update_progress,
+                            use_cache=use_cache
+                        )
+                        for name in RESULT_FIELDS:
+                            all_results[name].extend(batch_results[name])
+                        
+                        # Delay between batches
+                        if i + batch_size < len(urls_to_inspect):
+                            time.sleep(delay_between_batches)
+                finally:
+                    inspector.close()
+                
+                # Responses fetched with the cache off were written to disk; drop the older
+                # in-memory copies once per run (st.cache_data can only be cleared as a whole)
+                if not use_cache:
+                    _cached_inspect.clear()
                 
                 # Store results
-                st.session_state.inspection_results = all_results
+                st.session_state.results_cols = all_results
+                # Parse once here rather than on every rerun
+                st.session_state.df_results = build_results_dataframe(all_results)
+                st.session_state.results_summary = summarize_results(st.session_state.df_results)
                 
                 # Clear progress
                 progress_bar.empty()
                 status_text.empty()
                 
-                st.success(f"✅ Inspection complete! Processed {len(all_results)} URLs")
+                st.success(f"✅ Inspection complete! Processed {len(all_results['url'])} URLs")
             else:
                 st.warning("⚠️ No URLs to inspect")
         
         # Display results
-        if st.session_state.inspection_results:
+        if st.session_state.results_cols['url']:
             st.header("📊 Inspection Results")
             
-            # Parse results into DataFrame
-            parsed_results = []
-            for result in st.session_state.inspection_results:
-                if result['status'] == 'success':
-                    parsed = parse_inspection_result(result)
-                    parsed['url'] = result['url']
-                    parsed['status'] = 'success'
-                    parsed['timestamp'] = result['timestamp']
-                    parsed_results.append(parsed)
-                else:
-                    parsed_results.append({
-                        'url': result['url'],
-                        'status': 'error',
-                        'error': result.get('error', 'Unknown error'),
-                        'timestamp': result['timestamp']
-                    })
-            
-            df_results = pd.DataFrame(parsed_results)
+            df_results = st.session_state.df_results
+            summary = st.session_state.results_summary
+            filter_options = summary['filter_options']
             
             # Summary statistics
             col1, col2, col3, col4 = st.columns(4)
@@ -499,21 +763,18 @@ def main():
                 total_urls = len(df_results)
                 st.metric("Total URLs", total_urls)
             with col2:
-                success_count = len(df_results[df_results['status'] == 'success'])
+                success_count = summary['success_count']
                 st.metric("Successful", success_count)
             with col3:
-                error_count = len(df_results[df_results['status'] == 'error'])
-                st.metric("Errors", error_count)
+                st.metric("Errors", summary['error_count'])
             with col4:
-                if 'coverage_state' in df_results.columns:
-                    indexed_count = len(df_results[df_results['coverage_state'].str.contains('Indexed', na=False)])
-                    st.metric("Indexed", indexed_count)
+                if summary['indexed_count'] is not None:
+                    st.metric("Indexed", summary['indexed_count'])
             
             # Visualizations
             if success_count > 0:
                 st.subheader("📈 Visualizations")
-                df_success = df_results[df_results['status'] == 'success'].copy()
-                create_visualizations(df_success)
+                create_visualizations(summary['counts'])
             
             # Detailed results table
             st.subheader("📋 Detailed Results")
@@ -524,12 +785,12 @@ def main():
                 with col1:
                     filter_status = st.multiselect(
                         "Status",
-                        options=df_results['status'].unique(),
-                        default=df_results['status'].unique()
+                        options=filter_options['status'],
+                        default=filter_options['status']
                     )
                 with col2:
                     if 'coverage_state' in df_results.columns:
-                        coverage_states = df_results['coverage_state'].dropna().unique()
+                        coverage_states = filter_options['coverage_state']
                         filter_coverage = st.multiselect(
                             "Coverage State",
                             options=coverage_states,
@@ -537,7 +798,7 @@ def main():
                         )
                 with col3:
                     if 'mobile_verdict' in df_results.columns:
-                        mobile_verdicts = df_results['mobile_verdict'].dropna().unique()
+                        mobile_verdicts = filter_options['mobile_verdict']
                         filter_mobile = st.multiselect(
                             "Mobile Verdict",
                             options=mobile_verdicts,
@@ -551,20 +812,25 @@ def main():
             if 'mobile_verdict' in df_results.columns and filter_mobile:
                 filtered_df = filtered_df[filtered_df['mobile_verdict'].isin(filter_mobile)]
             
-            # Display table
+            # Display table, one page at a time so only the visible rows are sent to the browser
+            total_rows = len(filtered_df)
+            total_pages = max((total_rows + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+            page = st.number_input("Page", min_value=1, max_value=total_pages, value=1)
+            start = (page - 1) * PAGE_SIZE
             st.dataframe(
-                filtered_df,
+                filtered_df.iloc[start:start + PAGE_SIZE],
                 use_container_width=True,
                 height=400
             )
+            st.caption(f"Showing rows {min(start + 1, total_rows)}-{min(start + PAGE_SIZE, total_rows)} of {total_rows} (page {page} of {total_pages})")
             
             # Export options
             st.subheader("💾 Export Results")
-            col1, col2, col3 = st.columns(3)
+            col1, col2, col3, col4 = st.columns(4)
             
             with col1:
                 if export_format == "CSV":
-                    csv = filtered_df.to_csv(index=False)
+                    csv = export_to_csv(filtered_df)
                     st.download_button(
                         label="📥 Download CSV",
                         data=csv,
@@ -584,13 +850,26 @@ def main():
             
             with col3:
                 if export_format == "JSON":
-                    json_data = json.dumps(st.session_state.inspection_results, indent=2)
+                    json_data = orjson.dumps(
+                        results_to_records(st.session_state.results_cols),
+                        option=orjson.OPT_INDENT_2
+                    )
                     st.download_button(
                         label="📥 Download JSON",
                         data=json_data,
                         file_name=f"gsc_inspection_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                         mime="application/json"
                     )
+            
+            with col4:
+                if export_format == "Parquet":
+                    parquet_data = export_to_parquet(filtered_df)
+                    st.download_button(
+                        label="📥 Download Parquet",
+                        data=parquet_data,
+                        file_name=f"gsc_inspection_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet",
+                        mime="application/octet-stream"
+                    )
     else:
         st.info("👈 Please authenticate using your Google Search Console service account credentials in the sidebar.")
         
@@ -0,0 +1,262 @@
+import io
+import os
+import sys
+import threading
+from datetime import datetime
+
+import diskcache
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+
+class SessionState(dict):
+    """Stand-in for st.session_state outside a Streamlit runtime"""
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+class FakeClock:
+    """Monotonic clock where sleeping advances time instantly"""
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def monotonic(self):
+        with self._lock:
+            return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.now += max(seconds, 0)
+
+
+class StubService:
+    """Mimics service.urlInspection().index().inspect(body=...).execute(http=...)"""
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def urlInspection(self):
+        return self
+
+    def index(self):
+        return self
+
+    def inspect(self, body):
+        self._body = body
+        return self
+
+    def execute(self, http=None):
+        with self._lock:
+            self.calls.append(self.clock.monotonic())
+        return {'inspectionResult': {'indexStatusResult': {'verdict': 'PASS'}}}
+
+
+@pytest.fixture
+def clock(monkeypatch, tmp_path):
+    clock = FakeClock()
+    monkeypatch.setattr(app, '_mono', clock.monotonic)
+    monkeypatch.setattr(app.time, 'sleep', clock.sleep)
+    monkeypatch.setattr(app.st, 'session_state', SessionState(
+        quota_usage={'daily': 0, 'per_minute': 0, 'last_reset': datetime.now(), 'minute_reset': clock.monotonic()}
+    ))
+    disk_cache = diskcache.Cache(str(tmp_path))
+    monkeypatch.setattr(app, 'get_disk_cache', lambda: disk_cache)
+    yield clock
+    disk_cache.close()
+
+
+@pytest.mark.parametrize('max_workers', [1, 16])
+def test_batch_inspect_past_minute_limit(clock, max_workers):
+    service = StubService(clock)
+    inspector = app.GSCInspector(service, max_workers=max_workers)
+    urls = [f"https://example.com/page{i}" for i in range(900)]
+
+    try:
+        results = inspector.batch_inspect('https://example.com/', urls, use_cache=False)
+    finally:
+        inspector.close()
+
+    assert results['error'] == [None] * len(urls)
+    assert results['status'] == ['success'] * len(urls)
+    assert len(service.calls) == len(urls)
+
+
+def test_batch_inspect_stays_within_minute_limit(clock):
+    service = StubService(clock)
+    inspector = app.GSCInspector(service, max_workers=1)
+    urls = [f"https://example.com/page{i}" for i in range(1300)]
+
+    try:
+        inspector.batch_inspect('https://example.com/', urls, use_cache=False)
+    finally:
+        inspector.close()
+
+    calls = service.calls
+    for i, start in enumerate(calls):
+        in_window = sum(1 for t in calls[i:] if t < start + 60)
+        assert in_window <= inspector.minute_limit
+
+
+def test_new_run_waits_for_minute_window(clock):
+    # An earlier run in the same session already used most of this minute
+    app.st.session_state.quota_usage['per_minute'] = 590
+    service = StubService(clock)
+    inspector = app.GSCInspector(service, max_workers=4)
+    urls = [f"https://example.com/page{i}" for i in range(100)]
+
+    try:
+        results = inspector.batch_inspect('https://example.com/', urls, use_cache=False)
+    finally:
+        inspector.close()
+
+    assert results['status'] == ['success'] * len(urls)
+
+
+FULL_RESPONSE = {
+    'inspectionResult': {
+        'inspectionResultLink': 'https://search.google.com/search-console/inspect?resource_id=x',
+        'indexStatusResult': {
+            'verdict': 'PASS',
+            'coverageState': 'Submitted and indexed',
+            'indexingState': 'INDEXING_ALLOWED',
+            'lastCrawlTime': '2024-01-01T00:00:00Z',
+            'pageFetchState': 'SUCCESSFUL',
+            'robotsTxtState': 'ALLOWED',
+            'userCanonical': 'https://example.com/page',
+            'googleCanonical': 'https://example.com/page',
+            'crawledAs': 'MOBILE'
+        },
+        'mobileUsabilityResult': {'verdict': 'PASS'},
+        'richResultsResult': {
+            'verdict': 'PASS',
+            'detectedItems': [{'richResultType': 'FAQ'}, {'richResultType': 'Breadcrumbs'}]
+        }
+    }
+}
+
+PARSED_NAMES = [name for name, _, _, _ in app.PARSED_COLUMNS]
+
+
+def make_results(entries):
+    """Build column-wise results from (url, data or None, error or None) entries"""
+    results = app.empty_results()
+    for i, (url, data, error) in enumerate(entries):
+        results['url'].append(url)
+        results['status'].append('error' if error else 'success')
+        results['data'].append(data)
+        results['error'].append(error)
+        results['timestamp'].append(f"2024-01-01T00:00:0{i}")
+    return results
+
+
+def test_parse_full_response():
+    parsed = dict(zip(PARSED_NAMES, app._parse_result(FULL_RESPONSE)))
+
+    assert parsed == {
+        'inspection_result_link': 'https://search.google.com/search-console/inspect?resource_id=x',
+        'verdict': 'PASS',
+        'coverage_state': 'Submitted and indexed',
+        'indexing_state': 'INDEXING_ALLOWED',
+        'last_crawl_time': '2024-01-01T00:00:00Z',
+        'page_fetch_state': 'SUCCESSFUL',
+        'robots_txt_state': 'ALLOWED',
+        'user_canonical': 'https://example.com/page',
+        'google_canonical': 'https://example.com/page',
+        'mobile_verdict': 'PASS',
+        'rich_results_verdict': 'PASS',
+        'rich_results_detected': 'FAQ, Breadcrumbs',
+        'crawled_as': 'MOBILE'
+    }
+
+
+@pytest.mark.parametrize('data', [{'inspectionResult': {}}, {}])
+def test_parse_empty_response(data):
+    assert app._parse_result(data) == ('',) * len(PARSED_NAMES)
+
+
+def test_build_results_dataframe_mixed():
+    results = make_results([
+        ('https://example.com/a', None, 'API Error: boom'),
+        ('https://example.com/b', FULL_RESPONSE, None),
+        ('https://example.com/c', {}, None)
+    ])
+
+    df = app.build_results_dataframe(results)
+
+    assert df['url'].tolist() == results['url']
+    assert df['status'].tolist() == ['error', 'success', 'success']
+    assert df['error'].iloc[0] == 'API Error: boom'
+    assert df['error'].iloc[1:].isna().all()
+    assert df['coverage_state'].dtype == 'category'
+    assert df['coverage_state'].iloc[1] == 'Submitted and indexed'
+    assert df['rich_results_detected'].iloc[1] == 'FAQ, Breadcrumbs'
+    assert (df.loc[2, PARSED_NAMES] == '').all()
+
+    summary = app.summarize_results(df)
+    assert summary['success_count'] == 2
+    assert summary['error_count'] == 1
+    assert summary['indexed_count'] == 1
+
+
+def test_build_results_dataframe_errors_only():
+    results = make_results([
+        ('https://example.com/a', None, 'API Error: boom'),
+        ('https://example.com/b', None, 'Daily quota limit reached. Please try again later.')
+    ])
+
+    df = app.build_results_dataframe(results)
+
+    assert df.columns.tolist() == ['url', 'status', 'error', 'timestamp']
+    assert not set(PARSED_NAMES) & set(df.columns)
+
+    summary = app.summarize_results(df)
+    assert summary['indexed_count'] is None
+    assert summary['counts'] == {}
+    assert summary['filter_options'] == {'status': ['error']}
+
+
+@pytest.fixture
+def results_df():
+    return app.build_results_dataframe(make_results([
+        ('https://example.com/a', None, 'API Error: boom'),
+        ('https://example.com/b', FULL_RESPONSE, None),
+        ('https://example.com/c', {}, None)
+    ]))
+
+
+@pytest.mark.parametrize('filtered', [False, True])
+def test_export_to_csv_round_trip(results_df, filtered):
+    df = results_df.iloc[0:0] if filtered else results_df
+
+    exported = pd.read_csv(io.BytesIO(app.export_to_csv(df)), dtype=str, keep_default_na=False)
+
+    assert exported.columns.tolist() == df.columns.tolist()
+    expected = df.astype(object).where(df.notna(), '').astype(str)
+    pd.testing.assert_frame_equal(exported, expected.reset_index(drop=True), check_dtype=False)
+
+
+def test_export_to_csv_quoting(results_df):
+    lines = app.export_to_csv(results_df).decode().splitlines()
+
+    # Strings are quoted, empty strings are written as "" and nulls as empty fields
+    assert lines[0].startswith('"inspection_url","inspection_result_link"')
+    assert lines[1].startswith(',,')
+    assert '"https://example.com/c",""' in lines[3]
+
+
+@pytest.mark.parametrize('filtered', [False, True])
+def test_export_to_parquet_round_trip(results_df, filtered):
+    df = results_df.iloc[0:0] if filtered else results_df
+
+    exported = pd.read_parquet(io.BytesIO(app.export_to_parquet(df)))
+
+    assert exported.columns.tolist() == df.columns.tolist()
+    assert exported['url'].tolist() == df['url'].tolist()
+    assert exported['coverage_state'].astype(object).tolist() == df['coverage_state'].astype(object).tolist()
+    assert exported['error'].isna().tolist() == df['error'].isna().tolist()